@@ -18,17 +18,20 @@
 import math
 
 
-def angular_distance(position1, position2):
+def angular_distance(position1, position2, sincos_dec2=None):
     """
     Compute angular distance between start and end point.
     These points are tuples (ra,dec) in radians. Result is also in radians.
+    sincos_dec2 is optional precomputed (sin, cos) of position2 declination.
     """
     if position1[0] == position2[0] and position1[0] == position2[0]:
         return 0.0
     (start_ra, start_dec) = position1
     (end_ra, end_dec) = position2
+    if sincos_dec2 is None:
+        sincos_dec2 = (math.sin(end_dec), math.cos(end_dec))
     a = start_ra-end_ra
-    arg = math.sin(start_dec)*math.sin(end_dec) + math.cos(start_dec)*math.cos(end_dec)*math.cos(a)
+    arg = math.sin(start_dec)*sincos_dec2[0] + math.cos(start_dec)*sincos_dec2[1]*math.cos(a)
     return math.acos(arg)
 
 
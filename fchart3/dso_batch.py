@@ -0,0 +1,61 @@
+#    fchart3 draws beautiful deepsky charts in vector formats
+#    Copyright (C) 2005-2021 fchart authors
+#
+#    This program is free software; you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation; either version 2 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+import numpy as np
+
+
+class DSOBatch:
+    """
+    Deepsky objects drawn by batch methods of SkymapEngine stored as structure of arrays.
+
+    x, y        float32 positions in mm
+    r           float32 radii in mm, non positive radius means unknown size
+    kind        integer symbol kind of object
+    labelpos    selected label position
+    labels      list of labels
+    label_exts  list of extended labels or None
+    """
+    __slots__ = ('x', 'y', 'r', 'kind', 'labelpos', 'labels', 'label_exts')
+
+    def __init__(self, x, y, r, kind, labelpos, labels, label_exts):
+        self.x = np.asarray(x, dtype=np.float32)
+        self.y = np.asarray(y, dtype=np.float32)
+        self.r = np.asarray(r, dtype=np.float32)
+        self.kind = np.asarray(kind, dtype=np.int8)
+        self.labelpos = np.asarray(labelpos, dtype=np.int8)
+        self.labels = labels
+        self.label_exts = label_exts
+
+    def __len__(self):
+        return len(self.kind)
+
+    def sorted_by_kind(self):
+        """
+        Returns new batch with objects sorted by kind, order of objects of the same kind is kept
+        """
+        order = np.argsort(self.kind, kind='stable')
+        return DSOBatch(self.x[order], self.y[order], self.r[order], self.kind[order], self.labelpos[order],
+                        [self.labels[i] for i in order], [self.label_exts[i] for i in order])
+
+    def kind_slices(self):
+        """
+        Yields (kind, slice) for runs of objects of the same kind. Batch is expected to be sorted by kind.
+        """
+        kinds, starts = np.unique(self.kind, return_index=True)
+        ends = starts[1:].tolist() + [len(self.kind)]
+        for kind, start, end in zip(kinds.tolist(), starts.tolist(), ends):
+            yield kind, slice(start, end)
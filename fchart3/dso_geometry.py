@@ -0,0 +1,124 @@
+#    fchart3 draws beautiful deepsky charts in vector formats
+#    Copyright (C) 2005-2021 fchart authors
+#
+#    This program is free software; you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation; either version 2 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+"""
+Line segments of deepsky object symbols computed for whole arrays of objects.
+All functions take contiguous arrays of positions and sizes in mm and return array
+of segments [[x1, y1, x2, y2], ...] of dtype of positions, segments of one object
+are consecutive. Optional out is preallocated C-contiguous array of shape (N*k, 4),
+where k is number of segments of one symbol, the segments are written into it.
+"""
+
+import numpy as np
+
+GLOBULAR_CLUSTER_SEGMENT_COUNT = 2
+PLANETARY_NEBULA_SEGMENT_COUNT = 4
+DIFFUSE_NEBULA_SEGMENT_COUNT = 4
+UNKNOWN_OBJECT_SEGMENT_COUNT = 2
+
+
+def _segments_out(xs, segment_count, out):
+    """
+    Returns view of out (allocated if None) with one row of segment_count*4 coordinates per object
+    """
+    if out is None:
+        out = np.empty((len(xs)*segment_count, 4), dtype=xs.dtype)
+    return out, out.reshape(len(xs), segment_count*4)
+
+
+def globular_cluster_segments(xs, ys, rs, out=None):
+    """
+    Horizontal and vertical line through the circle of radius rs
+    """
+    out, o = _segments_out(xs, GLOBULAR_CLUSTER_SEGMENT_COUNT, out)
+    np.subtract(xs, rs, out=o[:, 0])
+    o[:, 1] = ys
+    np.add(xs, rs, out=o[:, 2])
+    o[:, 3] = ys
+    o[:, 4] = xs
+    np.subtract(ys, rs, out=o[:, 5])
+    o[:, 6] = xs
+    np.add(ys, rs, out=o[:, 7])
+    return out
+
+
+def planetary_nebula_segments(xs, ys, rs, out=None):
+    """
+    Four rays from the circle of radius 0.75*rs up to 1.5*rs
+    """
+    out, o = _segments_out(xs, PLANETARY_NEBULA_SEGMENT_COUNT, out)
+    r1s = 0.75*rs
+    r2s = 1.5*rs
+    np.subtract(xs, r1s, out=o[:, 0])
+    o[:, 1] = ys
+    np.subtract(xs, r2s, out=o[:, 2])
+    o[:, 3] = ys
+    np.add(xs, r1s, out=o[:, 4])
+    o[:, 5] = ys
+    np.add(xs, r2s, out=o[:, 6])
+    o[:, 7] = ys
+    o[:, 8] = xs
+    np.add(ys, r1s, out=o[:, 9])
+    o[:, 10] = xs
+    np.add(ys, r2s, out=o[:, 11])
+    o[:, 12] = xs
+    np.subtract(ys, r1s, out=o[:, 13])
+    o[:, 14] = xs
+    np.subtract(ys, r2s, out=o[:, 15])
+    return out
+
+
+def diffuse_nebula_segments(xs, ys, ds, linewidth, out=None):
+    """
+    Square with half side ds, horizontal sides are extended by half of linewidth
+    to close the corners
+    """
+    out, o = _segments_out(xs, DIFFUSE_NEBULA_SEGMENT_COUNT, out)
+    d1s = ds+linewidth/2.0
+    np.subtract(xs, d1s, out=o[:, 0])
+    np.add(ys, ds, out=o[:, 1])
+    np.add(xs, d1s, out=o[:, 2])
+    o[:, 3] = o[:, 1]
+    np.add(xs, ds, out=o[:, 4])
+    o[:, 5] = o[:, 1]
+    o[:, 6] = o[:, 4]
+    np.subtract(ys, ds, out=o[:, 7])
+    o[:, 8] = o[:, 2]
+    o[:, 9] = o[:, 7]
+    o[:, 10] = o[:, 0]
+    o[:, 11] = o[:, 7]
+    np.subtract(xs, ds, out=o[:, 12])
+    o[:, 13] = o[:, 7]
+    o[:, 14] = o[:, 12]
+    o[:, 15] = o[:, 1]
+    return out
+
+
+def unknown_object_segments(xs, ys, rs, out=None):
+    """
+    Diagonal cross with half size rs
+    """
+    out, o = _segments_out(xs, UNKNOWN_OBJECT_SEGMENT_COUNT, out)
+    np.subtract(xs, rs, out=o[:, 0])
+    np.add(ys, rs, out=o[:, 1])
+    np.add(xs, rs, out=o[:, 2])
+    np.subtract(ys, rs, out=o[:, 3])
+    o[:, 4] = o[:, 2]
+    o[:, 5] = o[:, 1]
+    o[:, 6] = o[:, 0]
+    o[:, 7] = o[:, 3]
+    return out
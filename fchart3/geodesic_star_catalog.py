@@ -611,11 +611,13 @@ class GeodesicStarCatalog(StarCatalog):
             zone_stars = self._cat_components[lev].get_zone_stars(zone)
             # print('Level={} Zone={} Len={}'.format(lev, zone, len(zone_stars)))
             if len(zone_stars) > 0:
-                mag = zone_stars['mag']
-                scal_dot = zone_stars['x']*field_rect3[0] + zone_stars['y']*field_rect3[1] + zone_stars['z']*field_rect3[2]
-                zone_stars = zone_stars[np.logical_and(mag <= lm_stars, scal_dot > cos_radius)]
+                # stars in zone are sorted by magnitude, cut faint stars before position test
+                zone_stars = zone_stars[:np.searchsorted(zone_stars['mag'], lm_stars, side='right')]
                 if len(zone_stars) > 0:
-                    stars.append(zone_stars)
+                    scal_dot = zone_stars['x']*field_rect3[0] + zone_stars['y']*field_rect3[1] + zone_stars['z']*field_rect3[2]
+                    zone_stars = zone_stars[scal_dot > cos_radius]
+                    if len(zone_stars) > 0:
+                        stars.append(zone_stars)
             zone = iterator.next()
         return stars
 
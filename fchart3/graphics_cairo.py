@@ -20,7 +20,7 @@ from math import pi
 import cairo
 import PIL.Image as Image
 
-from fchart3.graphics_interface import INCH, DPMM, POINT, GraphicsInterface, DrawMode
+from fchart3.graphics_interface import INCH, DPMM, POINT, GraphicsInterface, DrawMode, TEXT_CENTRED, TEXT_LEFT, TEXT_RIGHT
 
 DPI_IMG = 100.0
 DPMM_IMG = DPI_IMG/INCH
@@ -132,6 +132,14 @@ class CairoDrawing(GraphicsInterface):
         self.context.set_dash(self.gi_dash_style[0], self.gi_dash_style[1])
         self.context.stroke()
 
+    def lines(self, segments):
+        self.context.set_source_rgb(self.gi_pen_rgb[0], self.gi_pen_rgb[1], self.gi_pen_rgb[2])
+        for x1, y1, x2, y2 in segments:
+            self.context.move_to(x1, -y1)
+            self.context.line_to(x2, -y2)
+        self.context.set_dash(self.gi_dash_style[0], self.gi_dash_style[1])
+        self.context.stroke()
+
     def rectangle(self, x, y, width, height, mode=DrawMode.BORDER):
         self.context.rectangle(x, -y, width, height)
         self._draw_element(mode)
@@ -141,6 +149,12 @@ class CairoDrawing(GraphicsInterface):
         self.context.arc(x, -y, r, 0, 2.0*pi)
         self._draw_element(mode)
 
+    def circles(self, xs, ys, rs, mode=DrawMode.BORDER):
+        for x, y, r in zip(xs, ys, rs):
+            self._moveto(x+r, y)
+            self.context.arc(x, -y, r, 0, 2.0*pi)
+        self._draw_element(mode)
+
     def polygon(self, vertices, mode=DrawMode.BORDER):
         self.context.move_to(vertices[0][0], -vertices[0][1])
         for i in range(1, len(vertices)):
@@ -177,20 +191,34 @@ class CairoDrawing(GraphicsInterface):
         self.context.show_text(text)
 
     def text_right(self, x, y, text):
-        self._moveto(x, y)
         self.context.set_source_rgb(self.gi_pen_rgb[0], self.gi_pen_rgb[1], self.gi_pen_rgb[2])
-        self.context.show_text(text)
+        self._text_anchored(x, y, text, TEXT_RIGHT)
 
     def text_left(self, x, y, text):
-        xbearing, ybearing, width, height, dx, dy = self.context.text_extents(text)
-        self._moveto(x-width-xbearing, y)
         self.context.set_source_rgb(self.gi_pen_rgb[0], self.gi_pen_rgb[1], self.gi_pen_rgb[2])
-        self.context.show_text(text)
+        self._text_anchored(x, y, text, TEXT_LEFT)
 
     def text_centred(self, x, y, text):
-        xbearing, ybearing, width, height, dx, dy = self.context.text_extents(text)
-        self._moveto(x-width/2, y - height/2)
         self.context.set_source_rgb(self.gi_pen_rgb[0], self.gi_pen_rgb[1], self.gi_pen_rgb[2])
+        self._text_anchored(x, y, text, TEXT_CENTRED)
+
+    def text_batch(self, xs, ys, texts, anchors):
+        self.context.set_source_rgb(self.gi_pen_rgb[0], self.gi_pen_rgb[1], self.gi_pen_rgb[2])
+        for x, y, text, anchor in zip(xs, ys, texts, anchors):
+            self._text_anchored(x, y, text, anchor)
+
+    def _text_anchored(self, x, y, text, anchor):
+        """
+        Show text positioned by anchor (TEXT_CENTRED, TEXT_LEFT, TEXT_RIGHT) in the current source colour
+        """
+        if anchor == TEXT_CENTRED:
+            xbearing, ybearing, width, height, dx, dy = self.context.text_extents(text)
+            self._moveto(x-width/2, y - height/2)
+        elif anchor == TEXT_LEFT:
+            xbearing, ybearing, width, height, dx, dy = self.context.text_extents(text)
+            self._moveto(x-width-xbearing, y)
+        else:
+            self._moveto(x, y)
         self.context.show_text(text)
 
     def text_width(self, text):
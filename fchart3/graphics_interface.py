@@ -22,6 +22,11 @@ DPI = 72.0
 DPMM = DPI/INCH
 POINT = 1.0/DPMM
 
+# anchors of texts drawn by text_batch()
+TEXT_CENTRED = 0
+TEXT_LEFT = 1
+TEXT_RIGHT = 2
+
 
 class DrawMode(Enum):
     """
@@ -207,6 +212,15 @@ class GraphicsInterface:
         """
         print('GraphicsInterface.line()')
 
+    def lines(self, segments):
+        """
+        Draw lines given by segments [[x1, y1, x2, y2], ...] using the current pen
+        gray value, linestyle and linewidth. Derived classes should override this
+        method to draw all segments as one path.
+        """
+        for x1, y1, x2, y2 in segments:
+            self.line(x1, y1, x2, y2)
+
     def rectangle(self, x, y, width, height, mode=DrawMode.BORDER):
         """
         Draw a rectangle with left upper corner in (x,y) and widt/height
@@ -220,6 +234,14 @@ class GraphicsInterface:
         """
         print('GraphicsInterface.circle()')
 
+    def circles(self, xs, ys, rs, mode=DrawMode.BORDER):
+        """
+        Draw circles with centres at (xs[i],ys[i]) and radii rs[i]. Derived
+        classes should override this method to draw all circles as one path.
+        """
+        for x, y, r in zip(xs, ys, rs):
+            self.circle(x, y, r, mode)
+
     def polygon(self, vertices, mode=DrawMode.BORDER):
         """
         Draw a circle with specified vertices
@@ -259,6 +281,16 @@ class GraphicsInterface:
         """
         print('GraphicsInterface.text_centred()')
 
+    def text_batch(self, xs, ys, texts, anchors):
+        """
+        Draw texts[i] at (xs[i],ys[i]) in the current font and pen. anchors[i] is one of
+        TEXT_CENTRED, TEXT_LEFT, TEXT_RIGHT and selects text_centred, text_left or text_right.
+        Derived classes should override this method to set font and pen only once.
+        """
+        text_methods = (self.text_centred, self.text_left, self.text_right)
+        for x, y, text, anchor in zip(xs, ys, texts, anchors):
+            text_methods[anchor](x, y, text)
+
     def text_width(self, text):
         """
         Text width in current font
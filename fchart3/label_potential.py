@@ -19,48 +19,75 @@ import numpy as np
 
 
 class LabelPotential:
-    def __init__(self, fieldradius, deepskylist):
+    def __init__(self, fieldradius, xs, ys, sizes):
         """
         fieldradius in mm
-        deepskylist [(x,y,size), (x,y,size),...]
+        xs, ys, sizes - arrays of positions and sizes of objects
         x,y, size in mm
+
+        Positions and sizes are kept in preallocated buffers, only first n
+        items are valid. The buffers grow by doubling when labels are added.
         """
         self.fieldradius  = fieldradius
-        self.positions = np.zeros((len(deepskylist), 2))*0.0
-        self.sizes = np.zeros(len(deepskylist))*0.0
-        for i in range(len(deepskylist)):
-            _, x,y,s = deepskylist[i]
-            if s <= 0:
-                s = 1
-            self.sizes[i] = s**0.5
-            self.positions[i,0] = x
-            self.positions[i,1] = y
+        n = len(xs)
+        capacity = max(2*n, 16)
+        self._positions = np.zeros((capacity, 2), dtype=np.float64)
+        self._positions[:n, 0] = xs
+        self._positions[:n, 1] = ys
+        self._sizes = np.zeros(capacity, dtype=np.float64)
+        self._sizes[:n] = np.sqrt(np.where(np.asarray(sizes, dtype=np.float64) <= 0, 1.0, sizes))
+        self._n = n
+        self._sizes_sum = float(np.sum(self._sizes[:n]))
 
-    def add_position(self,x,y,size):
-        N = len(self.sizes)
-        newpos = np.zeros((N+1,2))*0.0
-        newpos[0:N,:] = self.positions
-        newpos[N,:] = [x,y]
+    @property
+    def positions(self):
+        return self._positions[:self._n]
 
-        newsize = np.zeros(N+1)*0.0
-        newsize[0:N] = self.sizes
-        newsize[N] = size**0.5
+    @property
+    def sizes(self):
+        return self._sizes[:self._n]
 
-        self.positions = newpos
-        self.sizes = newsize
+    def add_position(self,x,y,size):
+        n = self._n
+        if n == len(self._sizes):
+            capacity = 2*n
+            positions = np.zeros((capacity, 2), dtype=np.float64)
+            positions[:n] = self._positions
+            sizes = np.zeros(capacity, dtype=np.float64)
+            sizes[:n] = self._sizes
+            self._positions = positions
+            self._sizes = sizes
+        s = size**0.5
+        self._positions[n, 0] = x
+        self._positions[n, 1] = y
+        self._sizes[n] = s
+        self._sizes_sum += s
+        self._n = n + 1
 
     def compute_potential(self,x,y):
         """
         x,y in mm
         """
-        value = 0.0
-        ss = np.sum(self.sizes)
+        positions = self.positions
         rf = ((x**2+y**2)**0.5 - self.fieldradius)**-3
 
-        r2 = (self.positions[:,0]-x)**2 + (self.positions[:,1]-y)**2
+        r2 = (positions[:,0]-x)**2 + (positions[:,1]-y)**2
         sr = (r2+0.1)**(-1)
         p = self.sizes*sr
-        value = np.sum(p) + ss*rf
+        value = np.sum(p) + self._sizes_sum*rf
         return value
 
+    def compute_potentials(self, xs, ys):
+        """
+        Vectorized variant of compute_potential. xs, ys are arrays
+        of candidate positions in mm, returns array of potentials.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        positions = self.positions
+        rf = ((xs**2+ys**2)**0.5 - self.fieldradius)**-3
 
+        r2 = (positions[:,0]-xs[:,np.newaxis])**2 + (positions[:,1]-ys[:,np.newaxis])**2
+        sr = (r2+0.1)**(-1)
+        p = self.sizes*sr
+        return np.sum(p, axis=1) + self._sizes_sum*rf
@@ -17,7 +17,12 @@
 
 from math import pi
 
-from .graphics_interface import DrawMode
+import numpy as np
+
+from .graphics_interface import DrawMode, TEXT_CENTRED, TEXT_LEFT, TEXT_RIGHT
+
+# text anchors of mirrored texts, left and right are swapped
+MIRROR_X_TEXT_ANCHORS = np.array([TEXT_CENTRED, TEXT_RIGHT, TEXT_LEFT], dtype=np.int8)
 
 
 class MirroringGraphics:
@@ -44,9 +49,16 @@ class MirroringGraphics:
     def line(self, x1, y1, x2, y2):
         self.graphics.line(self.mul_x*x1, self.mul_y*y1, self.mul_x*x2, self.mul_y*y2)
 
+    def lines(self, segments):
+        segments = np.asarray(segments, dtype=float).reshape(-1, 4)
+        self.graphics.lines(segments * (self.mul_x, self.mul_y, self.mul_x, self.mul_y))
+
     def circle(self, x, y, r, mode=DrawMode.BORDER):
         self.graphics.circle(self.mul_x*x, self.mul_y*y, r, mode)
 
+    def circles(self, xs, ys, rs, mode=DrawMode.BORDER):
+        self.graphics.circles(self.mul_x*np.asarray(xs), self.mul_y*np.asarray(ys), rs, mode)
+
     def ellipse(self, x, y, rlong, rshort, position_angle, mode=DrawMode.BORDER):
         if self.mirror_x:
             position_angle += pi
@@ -72,6 +84,12 @@ class MirroringGraphics:
     def text_centred(self, x, y, text):
         self.graphics.text_centred(self.mul_x*x, self.mul_y*y, text)
 
+    def text_batch(self, xs, ys, texts, anchors):
+        anchors = np.asarray(anchors, dtype=np.int8)
+        if self.mirror_x:
+            anchors = MIRROR_X_TEXT_ANCHORS[anchors]
+        self.graphics.text_batch(self.mul_x*np.asarray(xs), self.mul_y*np.asarray(ys), texts, anchors)
+
     def set_pen_rgb(self, pen_rgb):
         """
         Sets gi_pen_rgb. Derived classes should extend, not override this method.
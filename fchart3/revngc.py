@@ -15,7 +15,7 @@
 #    along with this program; if not, write to the Free Software
 #    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 
-from numpy import *
+import numpy as np
 
 from . import deepsky_object as deepsky
 
@@ -37,8 +37,8 @@ def _parse_rev_ngcic_line(line, catalog='NGC'):
             object.type = deepsky.SNR
         object.constellation = line[15:18].upper()
 
-        ra = pi*(float(line[20:22])+float(line[23:25])/60.0 + float(line[26:28])/3600.0)/12.0
-        dec = pi*(float(line[32:34]) + float(line[35:37])/60.0 + float(line[38:40])/3600.0)/180.0
+        ra = np.pi*(float(line[20:22])+float(line[23:25])/60.0 + float(line[26:28])/3600.0)/12.0
+        dec = np.pi*(float(line[32:34]) + float(line[35:37])/60.0 + float(line[38:40])/3600.0)/180.0
         if line[31] == '-':
             dec *= -1.0
         object.ra = ra
@@ -55,18 +55,18 @@ def _parse_rev_ngcic_line(line, catalog='NGC'):
 
         rlongtext = line[61:67].rstrip()
         if rlongtext != '':
-            object.rlong = float(rlongtext)/60.0*pi/180.0/2.0
+            object.rlong = float(rlongtext)/60.0*np.pi/180.0/2.0
 
         rshorttext = line[68:73].rstrip()
         if rshorttext != '':
-            object.rshort = float(rshorttext)/60.0*pi/180.0/2.0
+            object.rshort = float(rshorttext)/60.0*np.pi/180.0/2.0
 
         if object.rshort < 0.0:
             object.rshort = object.rlong
 
         posangletext = line[74:77].rstrip()
         if posangletext != '':
-            object.position_angle = float(posangletext)*pi/180.0
+            object.position_angle = float(posangletext)*np.pi/180.0
 
         ID1text = line[96:111].strip()
         if ID1text != '':
@@ -124,7 +124,7 @@ if __name__=='__main__':
 
     winterlist = []
     for object in deeplist:
-        if object.ra >= pi/12.0 and object.ra < 9*pi/12.0 and object.dec > -35*pi/180 and object.mag < 12.5 and object.mag > -5.0:
+        if object.ra >= np.pi/12.0 and object.ra < 9*np.pi/12.0 and object.dec > -35*np.pi/180 and object.mag < 12.5 and object.mag > -5.0:
             winterlist.append(object)
 
     def magsort(x,y):
@@ -150,5 +150,5 @@ if __name__=='__main__':
             mlist.append(object)
             mnumbers.append(object.messier)
     print(len(mlist))
-    print(sort(mnumbers))
+    print(np.sort(mnumbers))
 
@@ -21,15 +21,17 @@ import math
 
 from time import time
 
-from .label_potential import *
-from .astrocalc import *
-from .np_astrocalc import *
-from .constellation import *
-from .mirroring_graphics import *
-from .configuration import *
+from .label_potential import LabelPotential
+from .astrocalc import angular_distance, radec_to_xy, radec_to_xyz
+from .np_astrocalc import np_direction_ddec, np_radec_to_xy, np_radec_to_xyz
+from .mirroring_graphics import MirroringGraphics
+from .configuration import EngineConfiguration
+from .dso_batch import DSOBatch
+from .dso_geometry import globular_cluster_segments, planetary_nebula_segments, diffuse_nebula_segments, unknown_object_segments
+from .dso_geometry import GLOBULAR_CLUSTER_SEGMENT_COUNT, PLANETARY_NEBULA_SEGMENT_COUNT, DIFFUSE_NEBULA_SEGMENT_COUNT, UNKNOWN_OBJECT_SEGMENT_COUNT
 from . import deepsky_object as deepsky
 
-from .graphics_interface import DrawMode
+from .graphics_interface import DrawMode, TEXT_CENTRED, TEXT_LEFT, TEXT_RIGHT
 
 from .widget_mag_scale import WidgetMagnitudeScale
 from .widget_map_scale import WidgetMapScale
@@ -119,9 +121,93 @@ GRID_DENSITY = 4
 RA_GRID_SCALE = [0.25, 0.5, 1, 2, 3, 5, 10, 15, 20, 30, 60, 2*60, 3*60]
 DEC_GRID_SCALE = [1, 2, 3, 5, 10, 15, 20, 30, 60, 2*60, 5*60, 10*60, 15*60, 20*60, 30*60, 45*60, 60*60]
 
+# deepsky object types drawn with own symbol, other types are drawn as unknown objects
+DSO_SYMBOL_TYPES = (deepsky.G, deepsky.N, deepsky.PN, deepsky.OC, deepsky.GC, deepsky.STARS, deepsky.SNR, deepsky.GALCL)
+
+# label placement of diffuse nebula by labelpos as (x size factor, x font height factor,
+# y size factor, y font height factor, text method), last item is used for labelpos -1
+DIFFUSE_NEBULA_LABEL_POS = (
+    (0.0, 0.0, -1.0, -1.0/2.0, TEXT_CENTRED),
+    (0.0, 0.0, 1.0, 1.0/2.0, TEXT_CENTRED),
+    (-1.0, -1.0/6.0, 0.0, -1.0/3.0, TEXT_LEFT),
+    (1.0, 1.0/6.0, 0.0, -1.0/3.0, TEXT_RIGHT),
+    (0.0, 0.0, -1.0, -1.0/2.0, TEXT_CENTRED),
+)
+
+# label placement of unknown object by labelpos, last item is default
+UNKNOWN_OBJECT_LABEL_POS = (
+    (1.0, 1.0/6.0, 0.0, -1.0/3.0, TEXT_RIGHT),
+    (-1.0, -1.0/6.0, 0.0, -1.0/3.0, TEXT_LEFT),
+    (0.0, 0.0, 1.0, 1.0/2.0, TEXT_CENTRED),
+    (0.0, 0.0, -1.0, -1.0/2.0, TEXT_CENTRED),
+)
+
+INV_SQRT2 = math.sqrt(0.5)
+
+# kinds of label placement of deepsky objects, other types are placed as unknown objects
+LABEL_GALAXY, LABEL_NEBULA, LABEL_CIRCULAR_OBJECT, LABEL_ASTERISM, LABEL_UNKNOWN_OBJECT = range(5)
+LABEL_KIND_COUNT = 5
+DSO_LABEL_KINDS = {
+    deepsky.G: LABEL_GALAXY,
+    deepsky.N: LABEL_NEBULA,
+    deepsky.PN: LABEL_CIRCULAR_OBJECT,
+    deepsky.OC: LABEL_CIRCULAR_OBJECT,
+    deepsky.GC: LABEL_CIRCULAR_OBJECT,
+    deepsky.SNR: LABEL_CIRCULAR_OBJECT,
+    deepsky.GALCL: LABEL_CIRCULAR_OBJECT,
+    deepsky.STARS: LABEL_ASTERISM,
+}
+
+# kinds of deepsky objects drawn by batch methods in drawing order
+BATCH_NEBULA, BATCH_PLANETARY_NEBULA, BATCH_GLOBULAR_CLUSTER, BATCH_SUPERNOVA_REMNANT, BATCH_UNKNOWN_OBJECT = range(5)
+
+# number of line segments of symbol of each batch kind
+BATCH_SEGMENT_COUNTS = (DIFFUSE_NEBULA_SEGMENT_COUNT, PLANETARY_NEBULA_SEGMENT_COUNT, GLOBULAR_CLUSTER_SEGMENT_COUNT, 0,
+                        UNKNOWN_OBJECT_SEGMENT_COUNT)
+
+# columns of label position tables for whole batches of labels
+DIFFUSE_NEBULA_LABEL_COEFS = np.array(DIFFUSE_NEBULA_LABEL_POS)
+UNKNOWN_OBJECT_LABEL_COEFS = np.array(UNKNOWN_OBJECT_LABEL_POS)
+
+# text methods of MirroringGraphics indexed by text anchor
+TEXT_METHODS = ('text_centred', 'text_left', 'text_right')
+
 MAG_SCALE_X = [0, 1,   2,   3,   4,    5,    25]
 MAG_SCALE_Y = [0, 1.8, 3.3, 4.7, 6,  7.2,  18.0]
 
+# star radius (without shift) tabulated by magnitude difference from limiting magnitude
+MAG_RADIUS_TABLE_STEP = 0.01
+MAG_RADIUS_TABLE = 0.1 * 1.33 ** np.interp(np.arange(0, MAG_SCALE_X[-1] + MAG_RADIUS_TABLE_STEP, MAG_RADIUS_TABLE_STEP), MAG_SCALE_X, MAG_SCALE_Y)
+
+
+def _float_arrays(*args):
+    return np.broadcast_arrays(*(np.asarray(arg, dtype=np.float64) for arg in args))
+
+
+def _horizontal_label_positions(xs, ys, label_length, out=None):
+    """
+    Build [start, centre, end] positions of horizontal labels from arrays of label
+    starts of shape (..., K), returns array of shape (..., K, 3, 2). The positions
+    are written into out if it is given.
+    """
+    label_length = np.expand_dims(label_length, -1)
+    label_pos = np.empty(xs.shape + (3, 2)) if out is None else out
+    label_pos[..., 0, 0] = xs
+    label_pos[..., 1, 0] = xs + label_length/2.0
+    label_pos[..., 2, 0] = xs + label_length
+    label_pos[..., :, 1] = ys[..., np.newaxis]
+    return label_pos
+
+
+def _circular_label_sin_a(r, fh):
+    """
+    Sine of the angle where the label baseline crosses the circle of radius r.
+    """
+    arg = 1.0-2*fh/(3.0*r)
+    if (arg < 1.0) and (arg > -1.0):
+        return math.sin(math.acos(arg))
+    return 1.0
+
 
 class SkymapEngine:
     def __init__(self, graphics, language=EN, ra=0.0, dec=0.0, fieldradius=-1.0, lm_stars=13.8, lm_deepsky=12.5, caption=''):
@@ -135,6 +221,9 @@ class SkymapEngine:
         self.language = language
         self.drawingwidth = self.graphics.gi_width
         self.drawingheight = self.graphics.gi_height
+        # default radii of deepsky symbols of unknown size, drawing width is fixed for the engine
+        self._default_r40 = self.drawingwidth/40.0
+        self._default_r60 = self.drawingwidth/60.0
         self.min_radius = 1.0  # of deepsky symbols (mm)
 
         self.lm_stars = lm_stars
@@ -149,6 +238,7 @@ class SkymapEngine:
         self.fieldsize = None
         self.scene_scale = None
         self.drawingscale = None
+        self._field_radius_mm = None
         self.legend_fontscale = None
         self.active_constellation = None
 
@@ -163,6 +253,7 @@ class SkymapEngine:
         self.mirroring_graphics = None
         self.picked_dso = None
         self.star_mag_r_shift = 0
+        self._text_width_cache = {}
 
     def set_field(self, ra, dec, fieldradius):
         """
@@ -183,6 +274,7 @@ class SkymapEngine:
             self.scene_scale = BASE_SCALE
 
         self.drawingscale = self.scene_scale*wh/2.0/math.sin(fieldradius)
+        self._field_radius_mm = self.drawingscale * math.sin(fieldradius)
         self.legend_fontscale = min(self.config.legend_font_scale, wh/100.0)
         self.set_caption(self.caption)
 
@@ -193,7 +285,7 @@ class SkymapEngine:
             self.star_mag_r_shift = self.magnitude_to_radius(self.lm_stars-self.config.star_mag_shift) - self.magnitude_to_radius(self.lm_stars)
 
     def get_field_radius_mm(self):
-        return self.drawingscale * math.sin(self.fieldradius)
+        return self._field_radius_mm
 
     def get_field_rect_mm(self):
         x = self.scene_scale * self.drawingwidth / 2.0
@@ -261,6 +353,18 @@ class SkymapEngine:
         if self.config.show_dso_legend:
             self.w_dso_legend.draw_dso_legend(self, self.graphics, self.config.legend_only)
 
+    def text_width(self, text):
+        """
+        Width of the text in the current font, memoized per font and font size. The cache
+        is cleared at the start of each map.
+        """
+        key = (text, self.graphics.gi_font, self.graphics.gi_fontsize)
+        width = self._text_width_cache.get(key)
+        if width is None:
+            width = self.graphics.text_width(text)
+            self._text_width_cache[key] = width
+        return width
+
     def draw_deepsky_objects(self, deepsky_catalog, showing_dsos, dso_highlights, dso_hide_filter, visible_dso_collector):
         if not self.config.show_deepsky:
             return
@@ -268,7 +372,8 @@ class SkymapEngine:
         # Draw deep sky
         # print('Drawing deepsky...')
 
-        deepsky_list = deepsky_catalog.select_deepsky(self.fieldcentre, self.fieldsize, self.lm_deepsky)
+        fc, fieldsize, scale, fc_sincos_dec = self.fieldcentre, self.fieldsize, self.drawingscale, self.fc_sincos_dec
+        deepsky_list = deepsky_catalog.select_deepsky(fc, fieldsize, self.lm_deepsky)
 
         filtered_showing_dsos = []
 
@@ -293,120 +398,142 @@ class SkymapEngine:
                         dso_hide_filter_set.remove(dso)
 
         deepsky_list.sort(key=lambda x: x.mag)
-        deepsky_list_ext = []
-
-        # calc for deepsky objects from selection
-        for dso in deepsky_list:
-            x, y = radec_to_xy(dso.ra, dso.dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
-            if dso.rlong is None:
-                rlong = self.min_radius
-            else:
-                rlong = dso.rlong*self.drawingscale
-                if rlong < self.min_radius:
-                    rlong = self.min_radius
-            deepsky_list_ext.append((dso, x, y, rlong))
 
-        # calc for deepsky objects from showing dsos
+        # append showing dsos which are in the field
         for dso in filtered_showing_dsos:
-            if angular_distance((dso.ra, dso.dec), self.fieldcentre) < self.fieldsize:
-                x, y, z = radec_to_xyz(dso.ra, dso.dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+            if angular_distance((dso.ra, dso.dec), fc, fc_sincos_dec) < fieldsize:
+                x, y, z = radec_to_xyz(dso.ra, dso.dec, fc, scale, fc_sincos_dec)
                 if z > 0:
-                    rlong = dso.rlong*self.drawingscale
-                    if rlong < self.min_radius:
-                        rlong = self.min_radius
-                    deepsky_list_ext.append((dso, x, y, rlong))
+                    deepsky_list.append(dso)
 
-        label_potential = LabelPotential(self.get_field_radius_mm(), deepsky_list_ext)
+        # structure of arrays for numeric fields of deepsky objects, unknown size is -1
+        dso_count = len(deepsky_list)
+        dso_ra = np.fromiter((dso.ra for dso in deepsky_list), dtype=np.float64, count=dso_count)
+        dso_dec = np.fromiter((dso.dec for dso in deepsky_list), dtype=np.float64, count=dso_count)
+        dso_rlong = np.fromiter((dso.rlong if dso.rlong is not None else -1.0 for dso in deepsky_list), dtype=np.float64, count=dso_count)
+        dso_rshort = np.fromiter((dso.rshort if dso.rshort is not None else -1.0 for dso in deepsky_list), dtype=np.float64, count=dso_count)
+        dso_position_angle = np.fromiter((dso.position_angle for dso in deepsky_list), dtype=np.float64, count=dso_count)
+
+        dso_x, dso_y = np_radec_to_xy(dso_ra, dso_dec, fc, scale, fc_sincos_dec)
+
+        # objects smaller than min_radius (or of unknown size) are enlarged keeping their aspect ratio
+        dso_rlong_mm = dso_rlong * scale
+        dso_rshort_mm = dso_rshort * scale
+        small = dso_rlong_mm <= self.min_radius
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dso_rshort_mm = np.where(small, dso_rshort_mm*(self.min_radius/dso_rlong_mm), dso_rshort_mm)
+        dso_rlong_mm = np.where(small, self.min_radius, dso_rlong_mm)
+
+        dso_posangle = dso_position_angle + np_direction_ddec((dso_ra, dso_dec), fc, fc_sincos_dec) + 0.5*np.pi
+
+        # galaxy labels are rotated by position angle flipped to the readable half-plane
+        dso_label_angle = np.where(dso_posangle >= 0.5*np.pi, dso_posangle + np.pi,
+                                   np.where(dso_posangle < -0.5*np.pi, dso_posangle - np.pi, dso_posangle))
+        dso_label_sin = np.sin(dso_label_angle)
+        dso_label_cos = np.cos(dso_label_angle)
+        dso_labels = [dso.label() for dso in deepsky_list]
+
+        label_potential = LabelPotential(self.get_field_radius_mm(), dso_x, dso_y, dso_rlong_mm)
 
         # print('Drawing objects...')
         pick_r = self.config.picker_radius if self.config.picker_radius > 0 else 0
         if pick_r > 0:
-            pick_min_r = pick_r**2
-            for dso, x, y, rlong in deepsky_list_ext:
-                if pick_r > 0 and abs(x) < pick_r and abs(y) < pick_r:
-                    r = x*x + y*y
-                    if r < pick_min_r:
-                        self.picked_dso = dso
-                        pick_min_r = r
-
-        for dso, x, y, rlong in deepsky_list_ext:
+            pick_dist = dso_x*dso_x + dso_y*dso_y
+            in_pick = (np.abs(dso_x) < pick_r) & (np.abs(dso_y) < pick_r) & (pick_dist < pick_r**2)
+            if np.any(in_pick):
+                self.picked_dso = deepsky_list[int(np.argmin(np.where(in_pick, pick_dist, np.inf)))]
+
+        dso_label_length = np.fromiter((self.text_width(label) for label in dso_labels), dtype=np.float64, count=dso_count)
+
+        # candidate label positions of all objects are computed at once into one preallocated array,
+        # objects are grouped by label kind, positions of i-th object are in row dso_label_row[i]
+        dso_label_kind = np.fromiter((DSO_LABEL_KINDS.get(dso.type, LABEL_UNKNOWN_OBJECT) for dso in deepsky_list),
+                                     dtype=np.int8, count=dso_count)
+        label_order = np.argsort(dso_label_kind, kind='stable')
+        label_bounds = np.searchsorted(dso_label_kind[label_order], np.arange(LABEL_KIND_COUNT+1)).tolist()
+        dso_label_positions = np.empty((dso_count, 4, 3, 2))
+        label_rows = [dso_label_positions[label_bounds[k]:label_bounds[k+1]] for k in range(LABEL_KIND_COUNT)]
+        dso_label_row = np.empty(dso_count, dtype=np.intp)
+        dso_label_row[label_order] = np.arange(dso_count)
+        dso_label_row = dso_label_row.tolist()
+
+        m = dso_label_kind == LABEL_GALAXY
+        self.galaxy_labelpos(dso_x[m], dso_y[m], dso_rlong_mm[m], dso_rshort_mm[m], dso_posangle[m], dso_label_length[m],
+                             (dso_label_sin[m], dso_label_cos[m]), out=label_rows[LABEL_GALAXY])
+        m = dso_label_kind == LABEL_NEBULA
+        self.diffuse_nebula_labelpos(dso_x[m], dso_y[m], 2.0*dso_rlong_mm[m], label_length=dso_label_length[m],
+                                     out=label_rows[LABEL_NEBULA])
+        m = dso_label_kind == LABEL_CIRCULAR_OBJECT
+        self.circular_object_labelpos(dso_x[m], dso_y[m], dso_rlong_mm[m], dso_label_length[m], out=label_rows[LABEL_CIRCULAR_OBJECT])
+        m = dso_label_kind == LABEL_ASTERISM
+        self.asterism_labelpos(dso_x[m], dso_y[m], dso_rlong_mm[m], dso_label_length[m], out=label_rows[LABEL_ASTERISM])
+        m = dso_label_kind == LABEL_UNKNOWN_OBJECT
+        self.unknown_object_labelpos(dso_x[m], dso_y[m], dso_rlong_mm[m], dso_label_length[m], out=label_rows[LABEL_UNKNOWN_OBJECT])
+
+        # symbols of simple objects are collected during label placement and drawn in batches sorted by kind
+        batch_index = []
+        batch_kinds = []
+        batch_labelpos = []
+        batch_label_ext = []
+
+        # galaxies are drawn without own save/restore, all other symbols set their pen and linewidth
+        self.graphics.save()
+        self.graphics.set_linewidth(self.config.dso_linewidth)
+
+        for i, dso, label, label_length, x, y, rlong, rshort, posangle in zip(
+                range(dso_count), deepsky_list, dso_labels, dso_label_length.tolist(), dso_x.tolist(), dso_y.tolist(),
+                dso_rlong_mm.tolist(), dso_rshort_mm.tolist(), dso_posangle.tolist()):
             if dso in dso_hide_filter_set:
                 continue
 
-            label = dso.label()
-
             if dso_highlights:
                 for dso_highligt in dso_highlights:
                     if dso in dso_highligt.dsos:
                         self.draw_dso_hightlight(x, y, rlong, label, dso_highligt, visible_dso_collector)
                         break
 
-            rlong = dso.rlong if dso.rlong is not None else self.min_radius
-            rshort = dso.rshort if dso.rshort is not None else self.min_radius
-            rlong = rlong*self.drawingscale
-            rshort = rshort*self.drawingscale
-            posangle = dso.position_angle+direction_ddec((dso.ra, dso.dec), self.fieldcentre, self.fc_sincos_dec)+0.5*np.pi
-
-            if rlong <= self.min_radius:
-                rshort *= self.min_radius/rlong
-                rlong = self.min_radius
-
             label_ext = None
             if dso == self.picked_dso and dso.mag < 100.0:
                 label_ext = '{:.2f}m'.format(dso.mag)
 
-            label_length = self.graphics.text_width(label)
-            labelpos = -1
+            label_positions = dso_label_positions[dso_label_row[i]]
+            pots = label_potential.compute_potentials(label_positions[:, 1, 0], label_positions[:, 1, 1])
+            labelpos = int(np.argmin(pots))
 
-            labelpos_list = []
-            if dso.type == deepsky.G:
-                labelpos_list = self.galaxy_labelpos(x, y, rlong, rshort, posangle, label_length)
-            elif dso.type == deepsky.N:
-                labelpos_list = self.diffuse_nebula_labelpos(x, y, 2.0*rlong, 2.0*rshort, posangle, label_length)
-            elif dso.type in [deepsky.PN, deepsky.OC, deepsky.GC, deepsky.SNR, deepsky.GALCL]:
-                labelpos_list = self.circular_object_labelpos(x, y, rlong, label_length)
-            elif dso.type == deepsky.STARS:
-                labelpos_list = self.asterism_labelpos(x, y, rlong, label_length)
-            else:
-                labelpos_list = self.unknown_object_labelpos(x, y, rlong, label_length)
-
-            pot = 1e+30
-            for labelpos_index in range(len(labelpos_list)):
-                [[x1, y1], [x2, y2], [x3, y3]] = labelpos_list[labelpos_index]
-                pot1 = label_potential.compute_potential(x2, y2)
-                # label_potential.compute_potential(x1,y1),
-                # label_potential.compute_potential(x3,y3)])
-                if pot1 < pot:
-                    pot = pot1
-                    labelpos = labelpos_index
-
-            [xx, yy] = labelpos_list[labelpos][1]
+            xx, yy = label_positions[labelpos, 1]
             label_potential.add_position(xx, yy, label_length)
 
+            batch_kind = None
             if dso.type == deepsky.G:
-                self.galaxy(x, y, rlong, rshort, posangle, dso.mag, label, label_ext, labelpos)
+                self._galaxy_inner(x, y, rlong, rshort, posangle, dso.mag, label, label_ext, labelpos)
             elif dso.type == deepsky.N:
                 has_outlines = False
                 if self.config.show_nebula_outlines and dso.outlines is not None and rlong > self.min_radius:
                     has_outlines = self.draw_dso_outlines(dso, x, y, rlong, rshort, posangle, label, label_ext, labelpos)
                 if not has_outlines:
-                    self.diffuse_nebula(x, y, 2.0*rlong, 2.0*rshort, posangle, label, label_ext, labelpos)
+                    batch_kind = BATCH_NEBULA
             elif dso.type == deepsky.PN:
-                self.planetary_nebula(x, y, rlong, label, label_ext, labelpos)
+                batch_kind = BATCH_PLANETARY_NEBULA
             elif dso.type == deepsky.OC:
                 if self.config.show_nebula_outlines and dso.outlines is not None:
                     has_outlines = self.draw_dso_outlines(dso, x, y, rlong, rshort)
                 self.open_cluster(x, y, rlong, label, label_ext, labelpos)
             elif dso.type == deepsky.GC:
-                self.globular_cluster(x, y, rlong, label, label_ext, labelpos)
+                batch_kind = BATCH_GLOBULAR_CLUSTER
             elif dso.type == deepsky.STARS:
                 self.asterism(x, y, rlong, label, label_ext, labelpos)
             elif dso.type == deepsky.SNR:
-                self.supernova_remnant(x, y, rlong, label, label_ext, labelpos)
+                batch_kind = BATCH_SUPERNOVA_REMNANT
             elif dso.type == deepsky.GALCL:
                 self.galaxy_cluster(x, y, rlong, label, label_ext, labelpos)
             else:
-                self.unknown_object(x, y, rlong, label, label_ext, labelpos)
+                batch_kind = BATCH_UNKNOWN_OBJECT
+
+            if batch_kind is not None:
+                batch_index.append(i)
+                batch_kinds.append(batch_kind)
+                batch_labelpos.append(labelpos)
+                batch_label_ext.append(label_ext)
 
             if visible_dso_collector is not None:
                 xs1, ys1 = x-rlong, y-rlong
@@ -422,16 +549,46 @@ class SkymapEngine:
                         pick_xp1, pick_yp1, pick_xp2, pick_yp2 = self.align_rect_coords(pick_xp1, pick_yp1, pick_xp2, pick_yp2)
                         visible_dso_collector.append([rlong, label.replace(' ', ''), pick_xp1, pick_yp1, pick_xp2, pick_yp2])
 
+        dso_batch = DSOBatch(dso_x[batch_index], dso_y[batch_index], dso_rlong_mm[batch_index], batch_kinds, batch_labelpos,
+                             [dso_labels[i] for i in batch_index], batch_label_ext)
+        self.draw_dso_batch(dso_batch.sorted_by_kind())
+
+        self.graphics.restore()
+
+    def draw_dso_batch(self, dso_batch):
+        """
+        Draw symbols and labels of DSOBatch sorted by kind, one batch method call per kind. Line segments
+        of symbols of all kinds are written into one buffer allocated for the whole batch.
+        """
+        draw_batches = (self.diffuse_nebula_batch, self.planetary_nebula_batch, self.globular_cluster_batch,
+                        self.supernova_remnant_batch, self.unknown_object_batch)
+        kind_slices = list(dso_batch.kind_slices())
+        segment_counts = [BATCH_SEGMENT_COUNTS[kind]*(sl.stop-sl.start) for kind, sl in kind_slices]
+        segments = np.empty((sum(segment_counts), 4), dtype=dso_batch.x.dtype)
+        segment_start = 0
+        for (kind, sl), segment_count in zip(kind_slices, segment_counts):
+            r = dso_batch.r[sl]
+            if kind == BATCH_NEBULA:
+                r = 2.0*r
+            batch_args = (dso_batch.x[sl], dso_batch.y[sl], r, dso_batch.labels[sl], dso_batch.label_exts[sl],
+                          dso_batch.labelpos[sl])
+            if segment_count > 0:
+                draw_batches[kind](*batch_args, segments_out=segments[segment_start:segment_start+segment_count])
+                segment_start += segment_count
+            else:
+                draw_batches[kind](*batch_args)
+
     def draw_dso_outlines(self, dso, x, y, rlong, rshort, posangle=None, label=None, label_ext=None,  labelpos=None):
         lev_shift = 0
         has_outlines = False
         draw_label = True
+        fc, scale, fc_sincos_dec = self.fieldcentre, self.drawingscale, self.fc_sincos_dec
         for outl_lev in range(2, -1, -1):
             outlines_ar = dso.outlines[outl_lev]
             if outlines_ar:
                 has_outlines = True
                 for outlines in outlines_ar:
-                    x_outl, y_outl = np_radec_to_xy(outlines[0], outlines[1], self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+                    x_outl, y_outl = np_radec_to_xy(outlines[0], outlines[1], fc, scale, fc_sincos_dec)
                     self.diffuse_nebula_outlines(x, y, x_outl, y_outl, outl_lev+lev_shift, 2.0*rlong, 2.0*rshort, posangle,
                                                  label, label_ext, draw_label, labelpos)
                     draw_label = False
@@ -440,10 +597,11 @@ class SkymapEngine:
         return has_outlines
 
     def draw_unknown_nebula(self, unknown_nebulas):
+        fc, scale, fc_sincos_dec = self.fieldcentre, self.drawingscale, self.fc_sincos_dec
         for uneb in unknown_nebulas:
             ra = (uneb.ra_min + uneb.ra_max) / 2.0
             dec = (uneb.dec_min + uneb.dec_max) / 2.0
-            x, y, z = radec_to_xyz(ra, dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+            x, y, z = radec_to_xyz(ra, dec, fc, scale, fc_sincos_dec)
             if z <=0:
                 continue
             for outl_lev in range(3):
@@ -452,7 +610,7 @@ class SkymapEngine:
                     continue
                 for outl in outlines:
                     if z > 0:
-                        x_outl, y_outl = np_radec_to_xy(outl[0], outl[1], self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+                        x_outl, y_outl = np_radec_to_xy(outl[0], outl[1], fc, scale, fc_sincos_dec)
                         self.unknown_diffuse_nebula_outlines(x_outl, y_outl, outl_lev)
 
     def draw_milky_way(self, milky_way_lines):
@@ -534,9 +692,10 @@ class SkymapEngine:
     def draw_extra_objects(self,extra_positions):
         # Draw extra objects
         # print('Drawing extra objects...')
+        fc, fieldsize, scale, fc_sincos_dec = self.fieldcentre, self.fieldsize, self.drawingscale, self.fc_sincos_dec
         for rax, decx, label, labelpos in extra_positions:
-            if angular_distance((rax, decx), self.fieldcentre) < self.fieldsize:
-                x, y = radec_to_xy(rax, decx, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+            if angular_distance((rax, decx), fc, fc_sincos_dec) < fieldsize:
+                x, y = radec_to_xy(rax, decx, fc, scale, fc_sincos_dec)
                 self.unknown_object(x, y, self.min_radius, label, labelpos)
 
     def draw_highlights(self, highlights, visible_dso_collector):
@@ -548,12 +707,13 @@ class SkymapEngine:
         fn = self.graphics.gi_fontsize
         highlight_fh = self.config.highlight_label_font_fac * fn
 
+        fc, fieldsize, scale, fc_sincos_dec = self.fieldcentre, self.fieldsize, self.drawingscale, self.fc_sincos_dec
         for hl_def in highlights:
             for rax, decx, object_name, label in hl_def.data:
-                if angular_distance((rax, decx), self.fieldcentre) < self.fieldsize:
+                if angular_distance((rax, decx), fc, fc_sincos_dec) < fieldsize:
                     self.graphics.set_pen_rgb(hl_def.color)
                     self.graphics.set_linewidth(hl_def.line_width)
-                    x, y = radec_to_xy(rax, decx, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+                    x, y = radec_to_xy(rax, decx, fc, scale, fc_sincos_dec)
                     if hl_def.style == 'cross':
                         r = self.config.font_size * 2
                         self.mirroring_graphics.line(x-r, y, x-r/2, y)
@@ -606,11 +766,12 @@ class SkymapEngine:
         x1 = None
         y1 = None
         z1 = None
-        r = self.min_radius * 1.2 / 2**0.5
+        r = self.min_radius * 1.2 * INV_SQRT2
 
+        fc, scale, fc_sincos_dec = self.fieldcentre, self.drawingscale, self.fc_sincos_dec
         for i in range(0, len(trajectory)):
             rax2, decx2, label2 = trajectory[i]
-            x2, y2, z2 = radec_to_xyz(rax2, decx2, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+            x2, y2, z2 = radec_to_xyz(rax2, decx2, fc, scale, fc_sincos_dec)
 
             if i > 0:
                 self.graphics.set_linewidth(self.config.constellation_linewidth)
@@ -638,8 +799,9 @@ class SkymapEngine:
     def magnitude_to_radius(self, magnitude):
         # radius = 0.13*1.35**(int(self.lm_stars)-magnitude)
         mag_d = self.lm_stars - np.clip(magnitude, a_min=None, a_max=self.lm_stars)
-        mag_s = np.interp(mag_d, MAG_SCALE_X, MAG_SCALE_Y)
-        radius = 0.1 * 1.33 ** mag_s + self.star_mag_r_shift
+        t = np.clip(mag_d / MAG_RADIUS_TABLE_STEP, 0, len(MAG_RADIUS_TABLE) - 1)
+        i = np.minimum(t.astype(np.int64), len(MAG_RADIUS_TABLE) - 2)
+        radius = MAG_RADIUS_TABLE[i] + (t - i) * (MAG_RADIUS_TABLE[i+1] - MAG_RADIUS_TABLE[i]) + self.star_mag_r_shift
         return radius
 
     def draw_stars(self, star_catalog, allow_star_pick):
@@ -662,16 +824,27 @@ class SkymapEngine:
         print('Faintest star: ' + str(round(max(selection['mag']), 2)))
 
         # tm = time()
-        x, y = np_radec_to_xy(selection['ra'], selection['dec'], self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+        ra = selection['ra'].astype(np.float64, copy=False)
+        dec = selection['dec'].astype(np.float64, copy=False)
+        x, y = np_radec_to_xy(ra, dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
 
         # print("Stars view positioning {} ms".format(str(time()-tm)), flush=True)
 
         mag = selection['mag']
         bsc = selection['bsc']
 
-        indices = np.argsort(mag)
-        magsorted = mag[indices]
-        rsorted = self.magnitude_to_radius(magsorted)
+        rr = self.magnitude_to_radius(mag)
+
+        x1, y1, x2, y2 = self.get_field_rect_mm()
+        visible = (x >= x1-rr) & (x <= x2+rr) & (y >= y1-rr) & (y <= y2+rr)
+
+        # sort only stars that will be drawn
+        visible_indices = np.flatnonzero(visible)
+        indices = visible_indices[np.argsort(mag[visible_indices], kind='stable')]
+        xsorted = x[indices]
+        ysorted = y[indices]
+        rsorted = rr[indices]
+        rounded_rsorted = np.rint(rsorted*100.0)/100.0
 
         if not self.config.star_colors:
             # self.graphics.set_pen_rgb((self.config.draw_color[0]/3, self.config.draw_color[0]/3, self.config.draw_color[0]/3))
@@ -682,23 +855,24 @@ class SkymapEngine:
         star_labels = []
         pick = None
         pick_min_r = pick_r**2
-        x1, y1, x2, y2 = self.get_field_rect_mm()
-        for i in range(len(indices)):
-            index = indices[i]
-            xx, yy, rr = (x[index].item(), y[index].item(), rsorted[i].item(),)
-            if (xx >= x1-rr) and (xx <= x2+rr) and (yy >= y1-rr) and (yy <= y2+rr):
-                if self.config.show_star_circles:
-                    self.star(xx, yy, rr, star_catalog.get_star_color(selection[index]))
-                if pick_r > 0 and abs(xx) < pick_r and abs(yy) < pick_r:
-                    r = xx*xx + yy*yy
-                    if r < pick_min_r:
-                        pick = (xx, yy, rr, mag[index], bsc[index])
-                        pick_min_r = r
-                else:
-                    if self.config.show_star_labels:
-                        bsc_star = selection[index]['bsc']
-                        if bsc_star is not None:
-                            star_labels.append((xx, yy, rr, bsc_star))
+        show_star_labels = self.config.show_star_labels
+        show_color_stars = self.config.show_star_circles and self.config.star_colors
+
+        if self.config.show_star_circles and not self.config.star_colors:
+            self.mirroring_graphics.circles(xsorted, ysorted, rounded_rsorted, DrawMode.FILL)
+
+        for index, xx, yy, rr, rounded_rr in zip(indices.tolist(), xsorted.tolist(), ysorted.tolist(), rsorted.tolist(), rounded_rsorted.tolist()):
+            if show_color_stars:
+                self.star(xx, yy, rounded_rr, star_catalog.get_star_color(selection[index]))
+            if pick_r > 0 and abs(xx) < pick_r and abs(yy) < pick_r:
+                r = xx*xx + yy*yy
+                if r < pick_min_r:
+                    pick = (xx, yy, rr, mag[index], bsc[index])
+                    pick_min_r = r
+            elif show_star_labels:
+                bsc_star = bsc[index]
+                if bsc_star is not None:
+                    star_labels.append((xx, yy, rr, bsc_star))
 
         if len(star_labels) > 0:
             self.draw_stars_labels(star_labels)
@@ -807,9 +981,10 @@ class SkymapEngine:
         dra = self.fieldradius / 10
         x11, y11, z11 = (None, None, None)
         agg_ra = 0
+        fc, scale, fc_sincos_dec = self.fieldcentre, self.drawingscale, self.fc_sincos_dec
         while True:
-            x12, y12, z12 = radec_to_xyz(self.fieldcentre[0] + agg_ra, dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
-            x22, y22, z22 = radec_to_xyz(self.fieldcentre[0] - agg_ra, dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+            x12, y12, z12 = radec_to_xyz(fc[0] + agg_ra, dec, fc, scale, fc_sincos_dec)
+            x22, y22, z22 = radec_to_xyz(fc[0] - agg_ra, dec, fc, scale, fc_sincos_dec)
             if x11 is not None and z11 > 0 and z12 > 0:
                 self.mirroring_graphics.line(x11, y11, x12, y12)
                 self.mirroring_graphics.line(x21, y21, x22, y22)
@@ -835,7 +1010,8 @@ class SkymapEngine:
 
     def draw_grid_dec(self):
         prev_steps, prev_grid_minutes = (None, None)
-        fc_cos = math.cos(self.fieldcentre[1])
+        fc = self.fieldcentre
+        fc_cos = math.cos(fc[1])
         for grid_minutes in RA_GRID_SCALE:
             steps = self.fieldradius / (fc_cos * (np.pi * grid_minutes / (12 * 60)))
             if steps < GRID_DENSITY:
@@ -845,7 +1021,7 @@ class SkymapEngine:
                 break
             prev_steps, prev_grid_minutes = (steps, grid_minutes)
 
-        max_visible_dec = self.fieldcentre[1]+self.fieldradius if self.fieldcentre[1] > 0 else self.fieldcentre[1]-self.fieldradius;
+        max_visible_dec = fc[1]+self.fieldradius if fc[1] > 0 else fc[1]-self.fieldradius;
         if max_visible_dec >= np.pi/2 or max_visible_dec <= -np.pi/2:
             ra_size = 2*np.pi
         else:
@@ -864,7 +1040,7 @@ class SkymapEngine:
 
         while ra_minutes <= 24*60:
             ra = np.pi * ra_minutes / (12*60)
-            if abs(self.fieldcentre[0]-ra) < ra_size or abs(self.fieldcentre[0]-2*np.pi-ra) < ra_size or abs(2*np.pi+self.fieldcentre[0]-ra) < ra_size:
+            if abs(fc[0]-ra) < ra_size or abs(fc[0]-2*np.pi-ra) < ra_size or abs(2*np.pi+fc[0]-ra) < ra_size:
                 self.draw_grid_dec_line(ra, ra_minutes, label_fmt)
             ra_minutes += grid_minutes
 
@@ -873,9 +1049,10 @@ class SkymapEngine:
         x11, y11, z11 = (None, None, None)
         x21, y21, z21 = (None, None, None)
         agg_dec = 0
+        fc, scale, fc_sincos_dec = self.fieldcentre, self.drawingscale, self.fc_sincos_dec
         while True:
-            x12, y12, z12 = radec_to_xyz(ra, self.fieldcentre[1] + agg_dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
-            x22, y22, z22 = radec_to_xyz(ra, self.fieldcentre[1] - agg_dec, self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
+            x12, y12, z12 = radec_to_xyz(ra, fc[1] + agg_dec, fc, scale, fc_sincos_dec)
+            x22, y22, z22 = radec_to_xyz(ra, fc[1] - agg_dec, fc, scale, fc_sincos_dec)
             if x11 is not None:
                 if z11 > 0 and z12 > 0:
                     self.mirroring_graphics.line(x11, y11, x12, y12)
@@ -887,7 +1064,7 @@ class SkymapEngine:
             if y12 > self.drawingheight/2 and y22 < -self.drawingheight/2:
                 label = self.grid_ra_label(ra_minutes, label_fmt)
                 self.graphics.save()
-                if self.fieldcentre[1] <= 0:
+                if fc[1] <= 0:
                     x = (x12-x11) * (self.drawingheight/2 - y11) / (y12 - y11) + x11
                     self.mirroring_graphics.translate(x, self.drawingheight/2)
                     text_ang = math.atan2(y11-y12, x11-x12)
@@ -911,17 +1088,18 @@ class SkymapEngine:
         x1, y1, z1 = np_radec_to_xyz(constell_catalog.all_constell_lines[:, 0], constell_catalog.all_constell_lines[:, 1], self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
         x2, y2, z2 = np_radec_to_xyz(constell_catalog.all_constell_lines[:, 2], constell_catalog.all_constell_lines[:, 3], self.fieldcentre, self.drawingscale, self.fc_sincos_dec)
 
-        for i in range(len(x1)):
-            if z1[i] > 0 and z2[i] > 0:
-                if self.config.constellation_linespace > 0:
-                    dx = x2[i] - x1[i]
-                    dy = y2[i] - y1[i]
-                    dr = math.sqrt(dx * dx + dy*dy)
-                    ddx = dx * self.config.constellation_linespace / dr
-                    ddy = dy * self.config.constellation_linespace / dr
-                    self.mirroring_graphics.line(x1[i] + ddx, y1[i] + ddy, x2[i] - ddx, y2[i] - ddy)
-                else:
-                    self.mirroring_graphics.line(x1[i], y1[i], x2[i], y2[i])
+        visible = (z1 > 0) & (z2 > 0)
+        x1, y1, x2, y2 = x1[visible], y1[visible], x2[visible], y2[visible]
+
+        if self.config.constellation_linespace > 0:
+            dx = x2 - x1
+            dy = y2 - y1
+            dr = np.sqrt(dx * dx + dy*dy)
+            ddx = dx * self.config.constellation_linespace / dr
+            ddy = dy * self.config.constellation_linespace / dr
+            x1, y1, x2, y2 = x1 + ddx, y1 + ddy, x2 - ddx, y2 - ddy
+
+        self.mirroring_graphics.lines(np.column_stack((x1, y1, x2, y2)))
 
         self.graphics.restore()
 
@@ -962,6 +1140,8 @@ class SkymapEngine:
         """
         visible_dso_collector = [] if visible_objects is not None else None
         self.picked_dso = None
+        # widths are cached only for one map, labels of long-lived engine would grow the cache without bound
+        self._text_width_cache.clear()
 
         if self.config.mirror_x or self.config.mirror_y:
             self.mirroring_graphics = MirroringGraphics(self.graphics, self.config.mirror_x, self.config.mirror_y)
@@ -1092,13 +1272,13 @@ class SkymapEngine:
     def star(self, x, y, radius, star_color):
         """
         Filled circle with boundary. Set fill colour and boundary
-        colour in advance using set_pen_rgb and set_fill_rgb
+        colour in advance using set_pen_rgb and set_fill_rgb. Radius is expected
+        to be already rounded to 0.01mm.
         """
         if self.config.star_colors and star_color:
             self.graphics.set_fill_rgb(star_color)
 
-        r = round(radius, 2)
-        self.mirroring_graphics.circle(x, y, r, DrawMode.FILL)
+        self.mirroring_graphics.circle(x, y, radius, DrawMode.FILL)
 
     def no_mirror_star(self, x, y, radius):
         """
@@ -1111,7 +1291,7 @@ class SkymapEngine:
     def open_cluster(self, x, y, radius, label, label_ext, labelpos):
         r = radius
         if radius <= 0.0:
-            r = self.drawingwidth/40.0
+            r = self._default_r40
 
         self.graphics.save()
 
@@ -1134,7 +1314,7 @@ class SkymapEngine:
     def galaxy_cluster(self, x, y, radius, label, label_ext, labelpos):
         r = radius
         if radius <= 0.0:
-            r = self.drawingwidth/40.0
+            r = self._default_r40
 
         self.graphics.save()
 
@@ -1167,9 +1347,8 @@ class SkymapEngine:
     def asterism(self, x, y, radius, label, label_ext, labelpos):
         r = radius
         if radius <= 0.0:
-            r = self.drawingwidth/40.0
-        w2 = 2**0.5
-        d = r/2.0*w2
+            r = self._default_r40
+        d = r*INV_SQRT2
 
         self.graphics.save()
 
@@ -1177,7 +1356,7 @@ class SkymapEngine:
         self.graphics.set_linewidth(self.config.open_cluster_linewidth)
         self.graphics.set_dashed_line(0.6, 0.4)
 
-        diff = self.graphics.gi_linewidth/2.0/w2
+        diff = 0.5*self.graphics.gi_linewidth*INV_SQRT2
 
         self.mirroring_graphics.line(x-diff, y+d+diff, x+d+diff, y-diff)
         self.mirroring_graphics.line(x+d, y, x, y-d)
@@ -1200,29 +1379,19 @@ class SkymapEngine:
 
         self.graphics.restore()
 
-    def asterism_labelpos(self, x, y, radius=-1, label_length=0.0):
+    def asterism_labelpos(self, x, y, radius=-1, label_length=0.0, out=None):
         """
-        x,y,radius, label_length in mm
-        returns [[start, centre, end],()]
+        x, y, radius, label_length in mm can be scalars or arrays of the same shape,
+        returns array of shape (..., 4, 3, 2) of [start, centre, end] label positions.
+        Optional out is preallocated array of that shape the positions are written into.
         """
-        r = radius
-        if radius <= 0.0:
-            r = self.drawingwidth/40.0
-        w2 = 2**0.5
-        d = r/2.0*w2
-        fh = self.graphics.gi_fontsize
-        label_pos_list = []
-        yy = y-d-2*fh/3.0
-        label_pos_list.append([[x-label_length/2.0, yy], [x, yy], [x+label_length, yy]])
-        yy = y+d+2*fh/3.0
-        label_pos_list.append([[x-label_length/2.0, yy], [x, yy], [x+label_length, yy]])
-        xx = x-d-fh/6.0
-        yy = y
-        label_pos_list.append([[xx-label_length, yy], [xx-label_length/2.0, yy], [xx, yy]])
-        xx = x+d+fh/6.0
-        yy = y
-        label_pos_list.append([[xx, yy], [xx+label_length/2.0, yy], [xx+label_length, yy]])
-        return label_pos_list
+        x, y, radius, label_length = _float_arrays(x, y, radius, label_length)
+        d = np.where(radius <= 0.0, self._default_r40, radius)*INV_SQRT2
+        fh_sixth = self.graphics.gi_fontsize/6.0
+
+        xs = np.stack((x - label_length/2.0, x - label_length/2.0, x - d - fh_sixth - label_length, x + d + fh_sixth), axis=-1)
+        ys = np.stack((y - d - 4.0*fh_sixth, y + d + 4.0*fh_sixth, y, y), axis=-1)
+        return _horizontal_label_positions(xs, ys, label_length, out)
 
     def draw_galaxy_label(self, x, y, label, labelpos, rlong, rshort, fh):
         if labelpos == 0 or labelpos == -1:
@@ -1240,18 +1409,25 @@ class SkymapEngine:
         if rlong < 0.0 => standard galaxy
         labelpos can be 0,1,2,3
         """
+        self.graphics.save()
+        self.graphics.set_linewidth(self.config.dso_linewidth)
+        self._galaxy_inner(x, y, rlong, rshort, posangle, mag, label, label_ext, labelpos)
+        self.graphics.restore()
+
+    def _galaxy_inner(self, x, y, rlong, rshort, posangle, mag, label, label_ext, labelpos):
+        """
+        Galaxy drawn with current linewidth, pen colour is left changed. Graphics state is saved
+        only for the label.
+        """
         rl = rlong
         rs = rshort
         if rlong <= 0.0:
-            rl = self.drawingwidth/40.0
+            rl = self._default_r40
             rs = rl/2.0
         if (rlong > 0.0) and (rshort < 0.0):
             rl = rlong
             rs = rlong/2.0
 
-        self.graphics.save()
-
-        self.graphics.set_linewidth(self.config.dso_linewidth)
         if self.config.dso_dynamic_brightness and (mag is not None) and self.lm_deepsky >= 10.0 and label_ext is None:
             fac = self.lm_deepsky - 8.0
             if fac > 5:
@@ -1278,6 +1454,7 @@ class SkymapEngine:
         self.mirroring_graphics.ellipse(x, y, rl, rs, p)
 
         if label or label_ext:
+            self.graphics.save()
             self.mirroring_graphics.translate(x, y)
             self.mirroring_graphics.rotate(p)
             self.graphics.set_pen_rgb((self.config.label_color[0]*dso_intensity,
@@ -1294,67 +1471,64 @@ class SkymapEngine:
                 self.draw_galaxy_label(x, y, label, labelpos, rlong, rshort, label_fh)
             if label_ext:
                 self.draw_galaxy_label(x, y, label_ext, self.to_ext_labelpos(labelpos), rlong, rshort, label_fh)
+            self.graphics.restore()
 
-        self.graphics.restore()
-
-    def galaxy_labelpos(self, x, y, rlong=-1, rshort=-1, posangle=0.0, label_length=0.0):
-        rl = rlong
-        rs = rshort
-        if rlong <= 0.0:
-            rl = self.drawingwidth/40.0
-            rs = rl/2.0
-        if (rlong > 0.0) and (rshort < 0.0):
-            rl = rlong
-            rs = rlong/2.0
+    def galaxy_labelpos(self, x, y, rlong=-1, rshort=-1, posangle=0.0, label_length=0.0, sincos_p=None, out=None):
+        """
+        x, y, rlong, rshort, posangle, label_length can be scalars or arrays of the same shape,
+        returns array of shape (..., 4, 3, 2) of [start, centre, end] label positions.
+        sincos_p - optional precomputed sin and cos of label angle (posangle flipped to readable half-plane)
+        Optional out is preallocated array of that shape the positions are written into.
+        """
+        x, y, rlong, rshort, posangle, label_length = _float_arrays(x, y, rlong, rshort, posangle, label_length)
 
-        p = posangle
-        if posangle >= 0.5*np.pi:
-            p += np.pi
-        if posangle < -0.5*np.pi:
-            p -= np.pi
+        if sincos_p is None:
+            p = np.where(posangle >= 0.5*np.pi, posangle + np.pi, np.where(posangle < -0.5*np.pi, posangle - np.pi, posangle))
+            sincos_p = (np.sin(p), np.cos(p))
 
+        sp, cp = sincos_p
         fh = self.graphics.gi_fontsize
-        label_pos_list = []
-
-        sp = math.sin(p)
-        cp = math.cos(p)
+        label_pos = np.empty(x.shape + (4, 3, 2)) if out is None else out
 
-        hl = label_length/2.0
+        # half of label length along label direction
+        hx = label_length/2.0*cp
+        hy = label_length/2.0*sp
 
+        # labels below and above are centred at distance d from the centre
         d = -rshort-0.5*fh
         xc = x + d*sp
         yc = y - d*cp
-        xs = xc - hl*cp
-        ys = yc - hl*sp
-        xe = xc + hl*cp
-        ye = yc + hl*sp
-        label_pos_list.append([[xs, ys], [xc, yc], [xe, ye]])
-
+        label_pos[..., 0, 1, 0] = xc
+        label_pos[..., 0, 1, 1] = yc
         xc = x - d*sp
         yc = y + d*cp
-        xs = xc - hl*cp
-        ys = yc - hl*sp
-        xe = xc + hl*cp
-        ye = yc + hl*sp
-        label_pos_list.append([[xs, ys], [xc, yc], [xe, ye]])
-
+        label_pos[..., 1, 1, 0] = xc
+        label_pos[..., 1, 1, 1] = yc
+        label_pos[..., :2, 0, 0] = label_pos[..., :2, 1, 0] - hx[..., np.newaxis]
+        label_pos[..., :2, 0, 1] = label_pos[..., :2, 1, 1] - hy[..., np.newaxis]
+        label_pos[..., :2, 2, 0] = label_pos[..., :2, 1, 0] + hx[..., np.newaxis]
+        label_pos[..., :2, 2, 1] = label_pos[..., :2, 1, 1] + hy[..., np.newaxis]
+
+        # label on the right starts, label on the left ends at distance d from the centre
         d = rlong+fh/6.0
         xs = x + d*cp
         ys = y + d*sp
-        xc = xs + hl*cp
-        yc = ys + hl*sp
-        xe = xc + hl*cp
-        ye = yc + hl*sp
-        label_pos_list.append([[xs, ys], [xc, yc], [xe, ye]])
+        label_pos[..., 2, 0, 0] = xs
+        label_pos[..., 2, 0, 1] = ys
+        label_pos[..., 2, 1, 0] = xs + hx
+        label_pos[..., 2, 1, 1] = ys + hy
+        label_pos[..., 2, 2, 0] = label_pos[..., 2, 1, 0] + hx
+        label_pos[..., 2, 2, 1] = label_pos[..., 2, 1, 1] + hy
 
         xe = x - d*cp
         ye = y - d*sp
-        xc = xe - hl*cp
-        yc = ye - hl*sp
-        xs = xc - hl*cp
-        ys = yc - hl*sp
-        label_pos_list.append([[xs, ys], [xc, yc], [xe, ye]])
-        return label_pos_list
+        label_pos[..., 3, 2, 0] = xe
+        label_pos[..., 3, 2, 1] = ye
+        label_pos[..., 3, 1, 0] = xe - hx
+        label_pos[..., 3, 1, 1] = ye - hy
+        label_pos[..., 3, 0, 0] = label_pos[..., 3, 1, 0] - hx
+        label_pos[..., 3, 0, 1] = label_pos[..., 3, 1, 1] - hy
+        return label_pos
 
     def to_ext_labelpos(self, labelpos):
         if labelpos == 0:
@@ -1372,114 +1546,105 @@ class SkymapEngine:
             fh = self.graphics.gi_fontsize
         if label:
             self.graphics.set_pen_rgb(self.config.label_color)
-            arg = 1.0-2*fh/(3.0*r)
-            if (arg < 1.0) and (arg > -1.0):
-                a = math.acos(arg)
-            else:
-                a = 0.5*np.pi
+            sin_a = _circular_label_sin_a(r, fh)
             if labelpos == 0 or labelpos == -1:
-                self.mirroring_graphics.text_right(x+math.sin(a)*r+fh/6.0, y-r, label)
+                self.mirroring_graphics.text_right(x+sin_a*r+fh/6.0, y-r, label)
             elif labelpos == 1:
-                self.mirroring_graphics.text_left(x-math.sin(a)*r-fh/6.0, y-r, label)
+                self.mirroring_graphics.text_left(x-sin_a*r-fh/6.0, y-r, label)
             elif labelpos == 2:
-                self.mirroring_graphics.text_right(x+math.sin(a)*r+fh/6.0, y+r-2*fh/3.0, label)
+                self.mirroring_graphics.text_right(x+sin_a*r+fh/6.0, y+r-2*fh/3.0, label)
             elif labelpos == 3:
-                self.mirroring_graphics.text_left(x-math.sin(a)*r-fh/6.0, y+r-2*fh/3.0, label)
+                self.mirroring_graphics.text_left(x-sin_a*r-fh/6.0, y+r-2*fh/3.0, label)
 
-    def circular_object_labelpos(self, x, y, radius=-1.0, label_length=0.0):
+    def circular_object_labelpos(self, x, y, radius=-1.0, label_length=0.0, out=None):
+        """
+        x, y, radius, label_length can be scalars or arrays of the same shape,
+        returns array of shape (..., 4, 3, 2) of [start, centre, end] label positions.
+        Optional out is preallocated array of that shape the positions are written into.
+        """
+        x, y, radius, label_length = _float_arrays(x, y, radius, label_length)
         fh = self.graphics.gi_fontsize
-        r = radius
-
-        if radius <= 0.0:
-            r = self.drawingwidth/40.0
+        r = np.where(radius <= 0.0, self._default_r40, radius)
 
+        # sine of the angle where the label baseline crosses the circle, see _circular_label_sin_a
         arg = 1.0-2*fh/(3.0*r)
+        inside = (arg < 1.0) & (arg > -1.0)
+        sin_a_r = np.where(inside, np.sin(np.arccos(np.where(inside, arg, 0.0))), 1.0)*r
+        fh_third, fh_sixth = fh/3.0, fh/6.0
 
-        if (arg < 1.0) and (arg > -1.0):
-            a = math.acos(arg)
-        else:
-            a = 0.5*np.pi
-
-        label_pos_list = []
-        xs = x+math.sin(a)*r+fh/6.0
-        ys = y-r+fh/3.0
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-        xs = x-math.sin(a)*r-fh/6.0 - label_length
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        xs = x+math.sin(a)*r+fh/6.0
-        ys = y+r-fh/3.0
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        xs = x+math.sin(a)*r+fh/6.0
-        ys = y+r-fh/3.0
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-        return label_pos_list
+        xs = np.stack((x+sin_a_r+fh_sixth, x-sin_a_r-fh_sixth - label_length, x+sin_a_r+fh_sixth, x+sin_a_r+fh_sixth), axis=-1)
+        ys = np.stack((y-r+fh_third, y-r+fh_third, y+r-fh_third, y+r-fh_third), axis=-1)
+        return _horizontal_label_positions(xs, ys, label_length, out)
 
     def globular_cluster(self, x, y, radius, label, label_ext, labelpos):
-        r = radius
-        if radius <= 0.0:
-            r = self.drawingwidth/40.0
+        self.globular_cluster_batch([x], [y], [radius], [label], [label_ext], [labelpos])
+
+    def globular_cluster_batch(self, xs, ys, radii, labels, label_exts, labelposes, segments_out=None):
+        """
+        Draw globular clusters given by arrays of positions and radii. Symbols are drawn
+        by one circles() and one lines() call, labels one by one. Optional segments_out
+        is preallocated array for line segments of symbols.
+        """
+        xs, ys, rs = self._dso_batch_arrays(xs, ys, radii, self._default_r40)
         self.graphics.save()
 
         self.graphics.set_linewidth(self.config.dso_linewidth)
         self.graphics.set_pen_rgb(self.config.star_cluster_color)
 
-        self.mirroring_graphics.circle(x, y, r)
-        self.mirroring_graphics.line(x-r, y, x+r, y)
-        self.mirroring_graphics.line(x, y-r, x, y+r)
-
-        if label_ext:
-            label_fh = self.config.ext_label_font_fac * self.graphics.gi_fontsize
-            self.graphics.set_font(self.graphics.gi_font, label_fh)
-        else:
-            label_fh = None
+        self.mirroring_graphics.circles(xs, ys, rs)
+        self.mirroring_graphics.lines(globular_cluster_segments(xs, ys, rs, segments_out))
 
-        self.draw_circular_object_label(x, y, r, label, labelpos, label_fh)
-        if label_ext:
-            self.draw_circular_object_label(x, y, r, label_ext, self.to_ext_labelpos(labelpos), label_fh)
+        self._draw_circular_object_labels(xs, ys, rs, labels, label_exts, labelposes)
 
         self.graphics.restore()
 
     def diffuse_nebula(self, x, y, width, height, posangle, label, label_ext, labelpos):
+        self.diffuse_nebula_batch([x], [y], [width], [label], [label_ext], [labelpos])
+
+    def diffuse_nebula_batch(self, xs, ys, widths, labels, label_exts, labelposes, segments_out=None):
+        """
+        Draw diffuse nebulas given by arrays of positions and widths as squares by one lines() call.
+        Optional segments_out is preallocated array for line segments of symbols.
+        """
+        xs, ys, ds = self._dso_batch_arrays(xs, ys, widths, None)
+        ds = np.where(ds < 0.0, self._default_r40, 0.5*ds)
+
         self.graphics.save()
 
         self.graphics.set_linewidth(self.config.nebula_linewidth)
         self.graphics.set_pen_rgb(self.config.nebula_color)
 
-        d = 0.5*width
-        if width < 0.0:
-            d = self.drawingwidth/40.0
-        d1 = d+self.graphics.gi_linewidth/2.0
-
-        self.mirroring_graphics.line(x-d1, y+d, x+d1, y+d)
-        self.mirroring_graphics.line(x+d, y+d, x+d, y-d)
-        self.mirroring_graphics.line(x+d1, y-d, x-d1, y-d)
-        self.mirroring_graphics.line(x-d, y-d, x-d, y+d)
-
-        if label_ext:
-            label_fh = self.config.ext_label_font_fac * self.graphics.gi_fontsize
-            self.graphics.set_font(self.graphics.gi_font, label_fh)
-        else:
-            label_fh = self.graphics.gi_fontsize
+        self.mirroring_graphics.lines(diffuse_nebula_segments(xs, ys, ds, self.graphics.gi_linewidth, segments_out))
 
+        fh = self.graphics.gi_fontsize
+        ext_fh = self.config.ext_label_font_fac * fh
         self.graphics.set_pen_rgb(self.config.label_color)
-        if label:
-            self.draw_diffuse_nebula_label(x, y, label, labelpos, d, label_fh)
-        if label_ext:
-            self.draw_diffuse_nebula_label(x, y, label_ext, self.to_ext_labelpos(labelpos), d, label_fh)
+
+        # labels in the current font are drawn by one text_batch() call
+        batched = np.fromiter((bool(label) and not label_ext for label, label_ext in zip(labels, label_exts)),
+                              dtype=bool, count=len(labels))
+        if np.any(batched):
+            coefs = DIFFUSE_NEBULA_LABEL_COEFS[np.asarray(labelposes)[batched]]
+            d = ds[batched]
+            self.mirroring_graphics.text_batch(xs[batched] + coefs[:, 0]*d + coefs[:, 1]*fh,
+                                               ys[batched] + coefs[:, 2]*d + coefs[:, 3]*fh,
+                                               [label for label, b in zip(labels, batched) if b],
+                                               coefs[:, 4].astype(np.int8))
+
+        for x, y, d, label, label_ext, labelpos in zip(xs.tolist(), ys.tolist(), ds.tolist(), labels, label_exts, labelposes):
+            if label_ext:
+                self.graphics.save()
+                self.graphics.set_font(self.graphics.gi_font, ext_fh)
+                if label:
+                    self.draw_diffuse_nebula_label(x, y, label, labelpos, d, ext_fh)
+                self.draw_diffuse_nebula_label(x, y, label_ext, self.to_ext_labelpos(labelpos), d, ext_fh)
+                self.graphics.restore()
 
         self.graphics.restore()
 
     def draw_diffuse_nebula_label(self, x, y, label, labelpos, d, fh):
-        if labelpos == 0 or labelpos == -1:
-            self.mirroring_graphics.text_centred(x, y-d-fh/2.0, label)
-        elif labelpos == 1:
-            self.mirroring_graphics.text_centred(x, y+d+fh/2.0, label)
-        elif labelpos == 2:
-            self.mirroring_graphics.text_left(x-d-fh/6.0, y-fh/3.0, label)
-        elif labelpos == 3:
-            self.mirroring_graphics.text_right(x+d+fh/6.0, y-fh/3.0, label)
+        xd, xfh, yd, yfh, anchor = DIFFUSE_NEBULA_LABEL_POS[labelpos]
+        getattr(self.mirroring_graphics, TEXT_METHODS[anchor])(x + xd*d + xfh*fh, y + yd*d + yfh*fh, label)
 
     def diffuse_nebula_outlines(self, x, y, x_outl, y_outl, outl_lev, width, height, posangle, label, label_ext,
                                 draw_label, labelpos=''):
@@ -1502,7 +1667,7 @@ class SkymapEngine:
 
         d = 0.5*width
         if width < 0.0:
-            d = self.drawingwidth/40.0
+            d = self._default_r40
 
         for i in range(len(x_outl)-1):
             self.mirroring_graphics.line(x_outl[i].item(), y_outl[i].item(), x_outl[i+1].item(), y_outl[i+1].item())
@@ -1546,131 +1711,130 @@ class SkymapEngine:
 
         self.graphics.restore()
 
-    def diffuse_nebula_labelpos(self, x, y, width=-1.0, height=-1.0, posangle=0.0, label_length=0.0):
-        d = 0.5*width
-        if width < 0.0:
-            d = self.drawingwidth/40.0
+    def diffuse_nebula_labelpos(self, x, y, width=-1.0, height=-1.0, posangle=0.0, label_length=0.0, out=None):
+        """
+        x, y, width, label_length can be scalars or arrays of the same shape,
+        returns array of shape (..., 4, 3, 2) of [start, centre, end] label positions.
+        Optional out is preallocated array of that shape the positions are written into.
+        """
+        x, y, width, label_length = _float_arrays(x, y, width, label_length)
+        d = np.where(width < 0.0, self._default_r40, 0.5*width)
         fh = self.graphics.gi_fontsize
 
-        label_pos_list = []
-        xs = x - label_length/2.0
-        ys = y-d-fh/2.0
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        ys = y+d+fh/2.0
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        xs = x - d - fh/6.0 - label_length
-        ys = y
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        xs = x + d + fh/6.0
-        ys = y
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-        return label_pos_list
+        xs = np.stack((x - label_length/2.0, x - label_length/2.0, x - d - fh/6.0 - label_length, x + d + fh/6.0), axis=-1)
+        ys = np.stack((y-d-fh/2.0, y+d+fh/2.0, y, y), axis=-1)
+        return _horizontal_label_positions(xs, ys, label_length, out)
 
     def planetary_nebula(self, x, y, radius, label, label_ext, labelpos):
-        r = radius
-        if radius <= 0.0:
-            r = self.drawingwidth/60.0
+        self.planetary_nebula_batch([x], [y], [radius], [label], [label_ext], [labelpos])
+
+    def planetary_nebula_batch(self, xs, ys, radii, labels, label_exts, labelposes, segments_out=None):
+        """
+        Draw planetary nebulas given by arrays of positions and radii. Symbols are drawn
+        by one circles() and one lines() call, labels one by one. Optional segments_out
+        is preallocated array for line segments of symbols.
+        """
+        xs, ys, rs = self._dso_batch_arrays(xs, ys, radii, self._default_r60)
         self.graphics.save()
 
         self.graphics.set_linewidth(self.config.dso_linewidth)
         self.graphics.set_pen_rgb(self.config.nebula_color)
 
-        self.mirroring_graphics.circle(x, y, 0.75*r)
-        self.mirroring_graphics.line(x-0.75*r, y, x-1.5*r, y)
-        self.mirroring_graphics.line(x+0.75*r, y, x+1.5*r, y)
-        self.mirroring_graphics.line(x, y+0.75*r, x, y+1.5*r)
-        self.mirroring_graphics.line(x, y-0.75*r, x, y-1.5*r)
-
-        if label_ext:
-            label_fh = self.config.ext_label_font_fac * self.graphics.gi_fontsize
-            self.graphics.set_font(self.graphics.gi_font, label_fh)
-        else:
-            label_fh = None
-
-        self.draw_circular_object_label(x, y, r, label, labelpos, label_fh)
+        self.mirroring_graphics.circles(xs, ys, 0.75*rs)
+        self.mirroring_graphics.lines(planetary_nebula_segments(xs, ys, rs, segments_out))
 
-        if label_ext:
-            self.draw_circular_object_label(x, y, r, label_ext, self.to_ext_labelpos(labelpos), label_fh)
+        self._draw_circular_object_labels(xs, ys, rs, labels, label_exts, labelposes)
 
         self.graphics.restore()
 
     def supernova_remnant(self, x, y, radius, label, label_ext, labelpos):
-        r = radius
-        if radius <= 0.0:
-            r = self.drawingwidth/40.0
+        self.supernova_remnant_batch([x], [y], [radius], [label], [label_ext], [labelpos])
+
+    def supernova_remnant_batch(self, xs, ys, radii, labels, label_exts, labelposes):
+        """
+        Draw supernova remnants given by arrays of positions and radii by one circles() call.
+        """
+        xs, ys, rs = self._dso_batch_arrays(xs, ys, radii, self._default_r40)
         self.graphics.save()
 
         self.graphics.set_linewidth(self.config.dso_linewidth)
         self.graphics.set_pen_rgb(self.config.nebula_color)
 
-        self.mirroring_graphics.circle(x, y, r-self.graphics.gi_linewidth/2.0)
+        self.mirroring_graphics.circles(xs, ys, rs-self.graphics.gi_linewidth/2.0)
 
-        if label_ext:
-            label_fh = self.config.ext_label_font_fac * self.graphics.gi_fontsize
-            self.graphics.set_font(self.graphics.gi_font, label_fh)
-        else:
-            label_fh = None
-
-        self.draw_circular_object_label(x, y, r, label, labelpos, label_fh)
-        if label_ext:
-            self.draw_circular_object_label(x, y, r, label_ext, self.to_ext_labelpos(labelpos), label_fh)
+        self._draw_circular_object_labels(xs, ys, rs, labels, label_exts, labelposes)
 
         self.graphics.restore()
 
     def unknown_object(self, x, y, radius, label, label_ext, labelpos):
-        r = radius
-        if radius <= 0.0:
-            r = self.drawingwidth/40.0
+        self.unknown_object_batch([x], [y], [radius], [label], [label_ext], [labelpos])
 
-        r /= 2**0.5
+    def unknown_object_batch(self, xs, ys, radii, labels, label_exts, labelposes, segments_out=None):
+        """
+        Draw unknown objects given by arrays of positions and radii as crosses by one lines() call.
+        Optional segments_out is preallocated array for line segments of symbols.
+        """
+        xs, ys, rs = self._dso_batch_arrays(xs, ys, radii, self._default_r40)
+        rs = rs*np.float32(INV_SQRT2)
         self.graphics.save()
 
         self.graphics.set_linewidth(self.config.dso_linewidth)
         self.graphics.set_pen_rgb(self.config.dso_color)
 
-        self.mirroring_graphics.line(x-r, y+r, x+r, y-r)
-        self.mirroring_graphics.line(x+r, y+r, x-r, y-r)
+        self.mirroring_graphics.lines(unknown_object_segments(xs, ys, rs, segments_out))
 
         fh = self.graphics.gi_fontsize
 
-        if label != '':
-            self.graphics.set_pen_rgb(self.config.label_color)
-            if labelpos == 0:
-                self.mirroring_graphics.text_right(x+r+fh/6.0, y-fh/3.0, label)
-            elif labelpos ==1:
-                self.mirroring_graphics.text_left(x-r-fh/6.0, y-fh/3.0, label)
-            elif labelpos == 2:
-                self.mirroring_graphics.text_centred(x, y + r + fh/2.0, label)
-            else:
-                self.mirroring_graphics.text_centred(x, y - r - fh/2.0, label)
+        self.graphics.set_pen_rgb(self.config.label_color)
+        batched = np.fromiter((label != '' for label in labels), dtype=bool, count=len(labels))
+        if np.any(batched):
+            labelposes = np.asarray(labelposes)[batched]
+            coefs = UNKNOWN_OBJECT_LABEL_COEFS[np.where((labelposes >= 0) & (labelposes <= 2), labelposes, 3)]
+            r = rs[batched]
+            self.mirroring_graphics.text_batch(xs[batched] + coefs[:, 0]*r + coefs[:, 1]*fh,
+                                               ys[batched] + coefs[:, 2]*r + coefs[:, 3]*fh,
+                                               [label for label, b in zip(labels, batched) if b],
+                                               coefs[:, 4].astype(np.int8))
         self.graphics.restore()
 
-    def unknown_object_labelpos(self, x, y, radius=-1, label_length=0.0):
-        r = radius
-        if radius <= 0.0:
-            r = self.drawingwidth/40.0
+    def unknown_object_labelpos(self, x, y, radius=-1, label_length=0.0, out=None):
+        """
+        x, y, radius, label_length can be scalars or arrays of the same shape,
+        returns array of shape (..., 4, 3, 2) of [start, centre, end] label positions.
+        Optional out is preallocated array of that shape the positions are written into.
+        """
+        x, y, radius, label_length = _float_arrays(x, y, radius, label_length)
+        r = np.where(radius <= 0.0, self._default_r40, radius)
         fh = self.graphics.gi_fontsize
-        r /= 2**0.5
-        label_pos_list = []
-        xs = x + r + fh/6.0
-        ys = y
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        xs = x - r - fh/6.0 - label_length
-        ys = y
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        xs = x - label_length/2.0
-        ys = y + r + fh/2.0
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-
-        xs = x - label_length/2.0
-        ys = y - r - fh/2.0
-        label_pos_list.append([[xs, ys], [xs+label_length/2.0, ys], [xs+label_length, ys]])
-        return label_pos_list
+        r *= INV_SQRT2
+
+        xs = np.stack((x + r + fh/6.0, x - r - fh/6.0 - label_length, x - label_length/2.0, x - label_length/2.0), axis=-1)
+        ys = np.stack((y, y, y + r + fh/2.0, y - r - fh/2.0), axis=-1)
+        return _horizontal_label_positions(xs, ys, label_length, out)
+
+    def _dso_batch_arrays(self, xs, ys, radii, default_radius):
+        """
+        Convert batch arguments to float32 arrays, non positive radii are replaced by default_radius.
+        Symbol geometry needs no more than sub-pixel precision, backends convert coordinates to double.
+        """
+        xs = np.asarray(xs, dtype=np.float32)
+        ys = np.asarray(ys, dtype=np.float32)
+        rs = np.asarray(radii, dtype=np.float32)
+        if default_radius is not None:
+            rs = np.where(rs <= 0.0, np.float32(default_radius), rs)
+        return xs, ys, rs
+
+    def _draw_circular_object_labels(self, xs, ys, rs, labels, label_exts, labelposes):
+        for x, y, r, label, label_ext, labelpos in zip(xs.tolist(), ys.tolist(), rs.tolist(), labels, label_exts, labelposes):
+            if label_ext:
+                label_fh = self.config.ext_label_font_fac * self.graphics.gi_fontsize
+                self.graphics.save()
+                self.graphics.set_font(self.graphics.gi_font, label_fh)
+                self.draw_circular_object_label(x, y, r, label, labelpos, label_fh)
+                self.draw_circular_object_label(x, y, r, label_ext, self.to_ext_labelpos(labelpos), label_fh)
+                self.graphics.restore()
+            else:
+                self.draw_circular_object_label(x, y, r, label, labelpos)
 
     def align_rect_coords(self, x1, y1, x2, y2):
         if x1 > x2:
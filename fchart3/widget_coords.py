@@ -52,7 +52,7 @@ class WidgetCoords:
         if decm == 60:
             decm = 0
 
-        text = str(rah).rjust(2) + self.language['h'] + str(ram) + self.language['m'] + str(ras) + self.language['s'] + \
-             ' ' + decsign + str(decd) + '°' + str(decm) + '\'' + str(decs) + '"'
+        lang = self.language
+        text = '{:2d}{}{}{}{}{} {}{}°{}\'{}"'.format(rah, lang['h'], ram, lang['m'], ras, lang['s'], decsign, decd, decm, decs)
 
         graphics.text_left(left, bottom, text)
@@ -17,8 +17,6 @@
 
 import numpy as np
 
-from . import deepsky_object as deepsky
-
 
 class WidgetDsoLegend:
 
@@ -46,25 +44,14 @@ class WidgetDsoLegend:
                       ('PN', len(self.language['PN'])),
                       ('PG',len(self.language['PG']))]
 
-        def labsort(x,y):
-            r = 0
-            if x[1] < y[1]:
-                r = -1
-            if x[1] > y[1]:
-                r = 1
-            return r
-
-        toplabels.sort(key = deepsky.cmp_to_key(labsort))
+        # ascending then reverse to reproduce the previous tie order, which reverse=True would not
+        toplabels.sort(key=lambda lab: lab[1])
         toplabels.reverse()
-        tl = []
-        for lab in toplabels:
-            tl.append(lab[0])
+        tl = [lab[0] for lab in toplabels]
 
-        bottomlabels.sort(key = deepsky.cmp_to_key(labsort))
+        bottomlabels.sort(key=lambda lab: lab[1])
         bottomlabels.reverse()
-        bl = []
-        for lab in bottomlabels:
-            bl.append(lab[0])
+        bl = [lab[0] for lab in bottomlabels]
 
         sky_map_engine.open_cluster(legendx, legendy - (tl.index('OCL') + 1)*legendinc, r)
         graphics.text_left(legendx + text_offset, legendy - (tl.index('OCL') + 1)*legendinc - fh/3.0, self.language['OCL'])
@@ -15,11 +15,17 @@
 #    along with this program; if not, write to the Free Software
 #    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 
-import numpy as np
+import math
+
+from bisect import bisect_right
 
 from .graphics_interface import DrawMode
 
 
+ALLOWED_RULER = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0) # arcminutes
+ALLOWED_RULER_LABELS = ('1\'', '5\'', '10\'', '30\'', '1°', '2°', '5°', '10°', '20°')
+
+
 class WidgetMapScale:
 
     def __init__(self, drawingscale, maxlength, legend_fontsize, legend_linewidth):
@@ -30,19 +36,15 @@ class WidgetMapScale:
         self._initialize()
 
     def _initialize(self):
-        # Determine a suitable scale ruler
-        allowed_ruler = np.array([1, 5, 10, 30, 60, 120, 300.0, 600.0, 1200.0]) # arcminutes
-        allowed_labels = ['1\'', '5\'', '10\'', '30\'', '1°', '2°', '5°', '10°', '20°']
-
-        ruler_mm = allowed_ruler*np.pi/(180.0*60.0)*self.drawingscale
-        self.ruler_label = ''
-        self.ruler_length = 0.0
-
-        for i in range(len(allowed_ruler)):
-            if ruler_mm[-(i+1)] <= self.maxlength:
-                self.ruler_label = allowed_labels[-(i+1)]
-                self.ruler_length = ruler_mm[-(i+1)]
-                break
+        # Determine a suitable scale ruler, the longest one not exceeding maxlength
+        arcmin_mm = math.pi/(180.0*60.0)*self.drawingscale
+        i = bisect_right(ALLOWED_RULER, self.maxlength/arcmin_mm) - 1
+        if i >= 0:
+            self.ruler_label = ALLOWED_RULER_LABELS[i]
+            self.ruler_length = ALLOWED_RULER[i]*arcmin_mm
+        else:
+            self.ruler_label = ''
+            self.ruler_length = 0.0
 
         fh = self.legend_fontsize * 0.66
         self.width, self.height = self.ruler_length + 2*fh, fh*3
@@ -71,16 +73,15 @@ class WidgetMapScale:
             graphics.rectangle(right-self.width, bottom+self.height, self.width, self.height, DrawMode.FILL)
             graphics.restore()
 
-        graphics.line(x, y, x - self.ruler_length, y)
-        graphics.line(x - lw/2.0, y - 0.5*fh,
-                      x - lw/2.0, y + 0.5*fh)
-        graphics.line(x - self.ruler_length + lw/2.0, y - 0.5*fh,
-                      x - self.ruler_length + lw/2.0, y + 0.5*fh)
+        # ruler with end bars and legend border as one path
+        graphics.lines(((x, y, x - self.ruler_length, y),
+                        (x - lw/2.0, y - 0.5*fh, x - lw/2.0, y + 0.5*fh),
+                        (x - self.ruler_length + lw/2.0, y - 0.5*fh, x - self.ruler_length + lw/2.0, y + 0.5*fh),
+                        (right-self.width, bottom+self.height, right, bottom+self.height),
+                        (right-self.width, bottom+self.height, right-self.width, bottom)))
+
         old_fontsize = graphics.gi_fontsize
         graphics.set_font(graphics.gi_font, fh)
         graphics.text_centred(x - self.ruler_length/2.0, y + graphics.gi_fontsize*2/3.0, self.ruler_label)
 
         graphics.set_font(graphics.gi_font, old_fontsize)
-
-        graphics.line(right-self.width, bottom+self.height, right, bottom+self.height)
-        graphics.line(right-self.width, bottom+self.height, right-self.width, bottom)